@@ -5,7 +5,16 @@ A tiny client to query AFAD 'event-service' and transform results into pandas Da
 
 __version__ = "0.1.0"
 
-from .api import AfadAPI
-from .dataset import EarthquakeDataset
+from .api import AfadAPI, AsyncAfadAPI, default_api
+from .geom import BBox
 
-__all__ = ["AfadAPI", "EarthquakeDataset"]
\ No newline at end of file
+__all__ = ["AfadAPI", "AsyncAfadAPI", "BBox", "EarthquakeDataset", "default_api"]
+
+
+def __getattr__(name):
+    # The dataset layer pulls in pandas (and numba for its kernels); import it on
+    # first use so HTTP-only callers start without them.
+    if name == "EarthquakeDataset":
+        from .dataset import EarthquakeDataset
+        return EarthquakeDataset
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
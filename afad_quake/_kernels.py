@@ -0,0 +1,68 @@
+"""Numeric kernels for the dataset layer (Numba-compiled when available)."""
+
+from __future__ import annotations
+
+import math
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:  # pragma: no cover
+    njit = None
+
+HAS_NUMBA = njit is not None
+
+
+if HAS_NUMBA:
+    # No 'nnan' fast-math flag: the NaN check below must not be optimized away.
+    @njit(parallel=True, fastmath={"contract", "afn", "arcp"}, cache=True)
+    def energy_from_mag(m, a, b, out):
+        """Fill out[i] = 10 ** (a + b * m[i]); NaN magnitudes give NaN energy."""
+        for i in prange(m.shape[0]):
+            v = m[i]
+            out[i] = np.nan if np.isnan(v) else 10.0 ** (a + b * v)
+
+    # Same flags: NaN coordinates must still come out as NaN distances.
+    @njit(parallel=True, fastmath={"contract", "afn", "arcp"}, cache=True)
+    def haversine_km(lat, lon, lats, lons, radius_km, out):
+        """Fill out[i] with the great-circle distance from (lat, lon) to (lats[i], lons[i])."""
+        phi1 = math.radians(lat)
+        cos_phi1 = math.cos(phi1)
+        for i in prange(lats.shape[0]):
+            phi2 = math.radians(lats[i])
+            s_phi = math.sin((phi2 - phi1) * 0.5)
+            s_lam = math.sin(math.radians(lons[i] - lon) * 0.5)
+            a = s_phi * s_phi + cos_phi1 * math.cos(phi2) * s_lam * s_lam
+            if a > 1.0:  # rounding near antipodes; NaN compares False and stays NaN
+                a = 1.0
+            out[i] = 2.0 * radius_km * math.asin(math.sqrt(a))
+else:
+    def energy_from_mag(m, a, b, out):
+        """Fill out[i] = 10 ** (a + b * m[i]); NaN magnitudes give NaN energy."""
+        np.multiply(m, b, out=out)
+        out += a
+        np.power(10.0, out, out=out)  # NaN propagates through every step
+
+    def haversine_km(lat, lon, lats, lons, radius_km, out):
+        """Fill out[i] with the great-circle distance from (lat, lon) to (lats[i], lons[i])."""
+        # a = sin^2(dphi/2) + cos(phi1) * cos(phi2) * sin^2(dlam/2), built in two buffers.
+        tmp = np.subtract(lons, lon)
+        np.radians(tmp, out=tmp)
+        tmp *= 0.5
+        np.sin(tmp, out=tmp)
+        np.square(tmp, out=tmp)
+        np.radians(lats, out=out)
+        np.cos(out, out=out)
+        out *= np.cos(np.radians(lat))
+        tmp *= out
+        np.subtract(lats, lat, out=out)
+        np.radians(out, out=out)
+        out *= 0.5
+        np.sin(out, out=out)
+        np.square(out, out=out)
+        out += tmp
+        np.minimum(out, 1.0, out=out)  # rounding can push near-antipodal points past 1
+        np.sqrt(out, out=out)
+        np.arcsin(out, out=out)
+        out *= 2.0 * radius_km
@@ -1,14 +1,29 @@
 from __future__ import annotations
 
+import asyncio
+import atexit
 import datetime as _dt
+import functools
+import email.utils
+import hashlib
+import json
+import math
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
 from typing import Any, Dict, Iterable, List, Literal, Optional, Tuple, Union
 
 import httpx
 
 from constants import (
     BASE_URL, API_ROOT, ENDPOINT_LATEST, ENDPOINT_FILTER,
-    DEFAULT_TIMEOUT, DEFAULT_TZ
+    DEFAULT_TIMEOUT, DEFAULT_TZ, DEFAULT_CACHE_TTL, CACHE_SETTLED_AFTER_DAYS,
+    DEFAULT_PAGE_SIZE, ALIAS_MAP, RETRY_STATUSES, MAX_RETRIES, RETRY_BACKOFF,
+    MAX_RETRY_AFTER
 )
+from geom import BBox, BBoxLike
 from logger import get_logger
 
 try:
@@ -17,10 +32,324 @@ try:
 except Exception:  # pragma: no cover
     ZoneInfo = None
 
+# Resolved once; ZoneInfo lookups are cached but still cost a call per use.
+_TZ = ZoneInfo(DEFAULT_TZ) if ZoneInfo is not None else None
+
+try:
+    # Optional: faster JSON decoding for large event lists
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
 # Types
-BBox = Tuple[float, float, float, float]          # (min_lat, min_lon, max_lat, max_lon)
 Radius = Tuple[float, float, float]               # (center_lat, center_lon, radius_km)
 OrderBy = Literal["timedesc", "timeasc", "magnitude", "depth"]
+TimeLike = Union[str, _dt.datetime, _dt.date]
+Window = Tuple[TimeLike, TimeLike]                # (start, end)
+
+STREAM_CHUNK_SIZE = 64 * 1024  # bytes read per chunk when streaming responses
+
+# No Accept-Encoding here: httpx fills it in and only advertises br/zstd when the
+# matching decoder (brotli / zstandard) is installed, so responses always decode.
+DEFAULT_HEADERS = {
+    "Accept": "application/json, text/plain, */*",
+    "User-Agent": "afad-quake/0.1 (+https://example.local)",
+}
+
+
+# ---------- Pure helpers (shared by AfadAPI and AsyncAfadAPI) ----------
+def _to_iso8601(
+    dt: TimeLike,
+    *,
+    assume_tz: Union[str, _dt.tzinfo, None] = _TZ,
+) -> str:
+    """
+    Convert input into ISO8601 string (no timezone suffix), suitable for AFAD filters.
+
+    AFAD endpoints commonly accept e.g. "2025-01-01T00:00:00".
+    If a naive datetime is provided, we assume `assume_tz` then drop tz info.
+    ISO strings are normalized the same way, so "2025-01-01 00:00:00" and
+    "2025-01-01T00:00:00" produce one request (and one cache entry); strings
+    that are not ISO 8601 are passed through unchanged.
+
+    Parameters
+    ----------
+    dt : Union[str, datetime, date]
+        The input date/time.
+    assume_tz : str | tzinfo
+        Timezone (name or object) to assume for naive datetime inputs.
+        Defaults to the pre-resolved Europe/Istanbul zone.
+
+    Returns
+    -------
+    str
+        ISO string like "YYYY-MM-DDTHH:MM:SS".
+    """
+    if isinstance(dt, str):
+        if len(dt) == 19 and dt[10] == "T":
+            return dt  # already canonical
+        try:
+            # C parser; accepts "T" or space, dates, offsets (Python 3.11+)
+            dt = _dt.datetime.fromisoformat(dt)
+        except ValueError:
+            return dt
+    if isinstance(dt, _dt.date) and not isinstance(dt, _dt.datetime):
+        # Interpret date as local midnight start
+        dt = _dt.datetime.combine(dt, _dt.time(0, 0, 0))
+    if isinstance(dt, _dt.datetime):
+        if isinstance(assume_tz, str):
+            assume_tz = ZoneInfo(assume_tz) if ZoneInfo is not None else None
+        if assume_tz is not None:
+            if dt.tzinfo is None:
+                dt = dt.replace(tzinfo=assume_tz)
+            else:
+                dt = dt.astimezone(assume_tz)
+
+        # Fixed numeric layout: an f-string skips strftime's format parsing.
+        return (
+            f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d}"
+            f"T{dt.hour:02d}:{dt.minute:02d}:{dt.second:02d}"
+        )
+    raise TypeError(f"Unsupported dt type: {type(dt)!r}")
+
+
+def _validate_bbox(bbox: BBoxLike) -> None:
+    BBox.coerce(bbox)  # BBox validates in __post_init__; instances were checked when built
+
+
+def _validate_radius(radius: Radius) -> None:
+    lat, lon, r_km = radius
+    if -90.0 <= lat <= 90.0 and -180.0 <= lon <= 180.0 and r_km > 0:
+        return
+    if not (-90.0 <= lat <= 90.0) or not (-180.0 <= lon <= 180.0):
+        raise ValueError("Center (lat, lon) out of range.")
+    if r_km <= 0:
+        raise ValueError("Radius (km) must be positive.")
+
+
+def _build_filter_params(
+    *,
+    start: TimeLike,
+    end: TimeLike,
+    orderby: OrderBy = "timedesc",
+    limit: Optional[int] = None,
+    bbox: Optional[BBoxLike] = None,
+    radius: Optional[Radius] = None,
+    extra_params: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    """Build /event/filter query params. See `AfadAPI.fetch_by_filter` for arguments."""
+    if bbox and radius:
+        raise ValueError("Provide either 'bbox' or 'radius', not both.")
+
+    params: Dict[str, Any] = {
+        "start": _to_iso8601(start),
+        "end": _to_iso8601(end),
+        "orderby": orderby,
+    }
+    if limit is not None:
+        params["limit"] = int(limit)
+
+    # Spatial filters
+    if bbox is not None:
+        box = BBox.coerce(bbox)
+        # AFAD filter param names (as observed in open-source tooling & examples)
+        params.update({
+            "minlat": box.min_lat,
+            "maxlat": box.max_lat,
+            "minlon": box.min_lon,
+            "maxlon": box.max_lon,
+        })
+    elif radius is not None:
+        _validate_radius(radius)
+        lat, lon, r_km = radius
+        # AFAD filter supports circular search with lat/lon and radius.
+        # Some docs mention minrad/maxrad where minrad can be empty (meaning circular).
+        params.update({
+            "lat": lat,
+            "lon": lon,
+            "maxrad": r_km,
+            "minrad": 0,
+        })
+
+    if extra_params:
+        # User-provided params take precedence
+        params.update(extra_params)
+
+    return params
+
+
+def _status_error(resp: httpx.Response) -> RuntimeError:
+    """Error for a non-200 AFAD response (its body must already be read)."""
+    # AFAD sometimes returns text/html messages for invalid params
+    return RuntimeError(f"AFAD HTTP {resp.status_code}: {resp.text[:300]}")
+
+
+def _retry_delay(attempt: int, resp: Optional[httpx.Response] = None) -> float:
+    """
+    Seconds to wait before retry number `attempt` (0-based).
+
+    Exponential backoff, raised to the server's Retry-After (seconds or an
+    HTTP date) when present, and capped at MAX_RETRY_AFTER.
+    """
+    delay = RETRY_BACKOFF * (2 ** attempt)
+    value = resp.headers.get("Retry-After") if resp is not None else None
+    if value:
+        try:
+            wait = float(value)
+        except ValueError:
+            try:
+                when = email.utils.parsedate_to_datetime(value)
+            except (TypeError, ValueError):
+                when = None
+            if when is not None and when.tzinfo is None:
+                when = when.replace(tzinfo=_dt.timezone.utc)  # no zone / "-0000": HTTP dates are GMT
+            wait = (when - _dt.datetime.now(tz=_dt.timezone.utc)).total_seconds() if when else 0.0
+        delay = max(delay, wait)
+    return min(delay, MAX_RETRY_AFTER)
+
+
+class _RateLimiter:
+    """
+    Spaces request starts at least 1/rps seconds apart (a leaky bucket).
+
+    `reserve()` books the next free slot and returns how long the caller must
+    wait for it, so sync callers `time.sleep` and async ones `asyncio.sleep`
+    on the same limiter. Thread-safe.
+    """
+
+    def __init__(self, rps: float) -> None:
+        if rps <= 0:
+            raise ValueError("rps must be positive.")
+        self.interval = 1.0 / float(rps)
+        self._next = 0.0
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next)
+            self._next = slot + self.interval
+        return slot - now
+
+
+def _decode_events(payload: Union[bytes, bytearray]) -> List[Dict[str, Any]]:
+    """Decode an AFAD response body and return its raw event list."""
+    # The endpoint typically returns a JSON array of events.
+    # orjson.JSONDecodeError subclasses ValueError, so one handler covers both.
+    try:
+        data = orjson.loads(payload) if orjson is not None else json.loads(payload)
+    except ValueError as e:
+        snippet = bytes(payload[:300]).decode("utf-8", "replace")
+        raise RuntimeError(f"AFAD returned non-JSON payload: {snippet}") from e
+
+    if isinstance(data, dict) and "data" in data:
+        # Defensive: in case it's wrapped
+        return data["data"]  # type: ignore[return-value]
+    if isinstance(data, list):
+        return data  # type: ignore[return-value]
+
+    raise RuntimeError(f"Unexpected AFAD response type: {type(data)!r}")
+
+
+def _local_naive(value: TimeLike) -> _dt.datetime:
+    """Parse a filter bound or event time as naive Europe/Istanbul wall time."""
+    dt = _dt.datetime.fromisoformat(_to_iso8601(value))
+    if dt.tzinfo is not None and _TZ is not None:
+        dt = dt.astimezone(_TZ).replace(tzinfo=None)
+    return dt.replace(tzinfo=None, microsecond=0)
+
+
+def _event_time(item: Dict[str, Any]) -> Optional[_dt.datetime]:
+    """Time of a raw event (first usable alias), or None if it has none."""
+    for key in ALIAS_MAP["time"]:
+        value = item.get(key)
+        if value:
+            try:
+                return _local_naive(str(value))
+            except ValueError:
+                return None
+    return None
+
+
+def _event_id(item: Dict[str, Any]) -> Any:
+    """Event id of a raw event (first present alias), or None."""
+    for key in ALIAS_MAP["event_id"]:
+        value = item.get(key)
+        if value is not None:
+            return value
+    return None
+
+
+class _ResponseCache:
+    """
+    Small on-disk cache of parsed AFAD responses, one JSON file per request.
+
+    Entries older than `ttl` seconds are refetched, except /event/filter windows
+    that ended more than CACHE_SETTLED_AFTER_DAYS ago: those are treated as final
+    and never expire. Expired entries are still served if the refetch fails.
+    """
+
+    def __init__(self, directory: Union[str, Path], ttl: float) -> None:
+        self.directory = Path(directory)
+        self.ttl = float(ttl)
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, url: str, params: Dict[str, Any]) -> Path:
+        raw = url + repr(sorted(params.items()))
+        key = hashlib.blake2b(raw.encode("utf-8"), digest_size=16).hexdigest()
+        return self.directory / f"{key}.json"
+
+    @staticmethod
+    def _is_settled(params: Dict[str, Any]) -> bool:
+        end = params.get("end")
+        if not isinstance(end, str):
+            return False
+        try:
+            end_dt = _dt.datetime.fromisoformat(end)
+        except ValueError:
+            return False
+        if end_dt.tzinfo is not None:
+            end_dt = end_dt.astimezone(_TZ).replace(tzinfo=None)
+        now = _dt.datetime.now(tz=_TZ).replace(tzinfo=None)
+        return end_dt < now - _dt.timedelta(days=CACHE_SETTLED_AFTER_DAYS)
+
+    def get(
+        self,
+        url: str,
+        params: Dict[str, Any],
+        *,
+        allow_stale: bool = False,
+    ) -> Optional[List[Dict[str, Any]]]:
+        path = self._path(url, params)
+        try:
+            age = time.time() - path.stat().st_mtime
+            if age > self.ttl and not allow_stale and not self._is_settled(params):
+                return None
+            payload = path.read_bytes()
+            return orjson.loads(payload) if orjson is not None else json.loads(payload)
+        except (OSError, ValueError):
+            # Missing or unreadable entry: just fetch again.
+            return None
+
+    def put(self, url: str, params: Dict[str, Any], items: List[Dict[str, Any]]) -> None:
+        path = self._path(url, params)
+        payload = (
+            orjson.dumps(items) if orjson is not None
+            else json.dumps(items, ensure_ascii=False).encode("utf-8")
+        )
+        # Write to a temp file and rename, so readers never see a partial entry.
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(payload)
+            os.replace(tmp, path)
+        except BaseException:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+            raise
+
 
 class AfadAPI:
     """
@@ -44,6 +373,14 @@ class AfadAPI:
         HTTP timeout in seconds.
     client : httpx.Client, optional
         An existing httpx client. If not provided, a new client will be created.
+    cache_dir : str | Path, optional
+        Directory for an on-disk response cache. Disabled when None (default).
+    cache_ttl : float, optional
+        Seconds before a cached response is refetched. Windows that ended more
+        than a week ago never expire, since AFAD no longer revises them.
+    rps : float, optional
+        Client-side rate limit in requests per second (cache hits are free).
+        Unlimited when None (default).
 
     Examples
     --------
@@ -63,22 +400,35 @@ class AfadAPI:
         base_url: str = BASE_URL,
         timeout: float = DEFAULT_TIMEOUT,
         client: Optional[httpx.Client] = None,
+        cache_dir: Optional[Union[str, Path]] = None,
+        cache_ttl: float = DEFAULT_CACHE_TTL,
+        rps: Optional[float] = None,
     ) -> None:
         self._logger = get_logger()
         self.base_url = base_url.rstrip("/")
         self.timeout = float(timeout)
         self._client = client  # We'll create one lazily if not provided.
+        self._cache = _ResponseCache(cache_dir, cache_ttl) if cache_dir is not None else None
+        self._limiter = _RateLimiter(rps) if rps is not None else None
 
     # ---------- Lifecycle ----------
     def _ensure_client(self) -> httpx.Client:
-        self._client = httpx.Client(
-            timeout=self.timeout,
-            follow_redirects=True,
-            headers={
-                "Accept": "application/json, text/plain, */*",
-                "User-Agent": "afad-quake/0.1 (+https://example.local)",
-            },
-        )
+        # Build the client once and keep it: repeated calls to the same AFAD host
+        # then reuse the pooled keep-alive connection instead of a new TLS handshake.
+        if self._client is None:
+            # No custom transport: httpx only mounts HTTP(S)_PROXY / ALL_PROXY from
+            # the environment when it builds the transport itself.
+            self._client = httpx.Client(
+                timeout=self.timeout,
+                follow_redirects=True,
+                http2=True,
+                limits=httpx.Limits(
+                    max_keepalive_connections=10,
+                    max_connections=20,
+                    keepalive_expiry=30.0,
+                ),
+                headers=DEFAULT_HEADERS,
+            )
         return self._client
 
     def close(self) -> None:
@@ -98,96 +448,73 @@ class AfadAPI:
     def _url(self, endpoint: str) -> str:
         return f"{self.base_url}{API_ROOT}{endpoint}"
 
-    # ---------- Time helpers ----------
-    @staticmethod
-    def _to_iso8601(
-        dt: Union[str, _dt.datetime, _dt.date],
-        *,
-        assume_tz: str = DEFAULT_TZ,
-    ) -> str:
-        """
-        Convert input into ISO8601 string (no timezone suffix), suitable for AFAD filters.
-
-        AFAD endpoints commonly accept e.g. "2025-01-01T00:00:00".
-        If a naive datetime is provided, we assume `assume_tz` then drop tz info.
-
-        Parameters
-        ----------
-        dt : Union[str, datetime, date]
-            The input date/time.
-        assume_tz : str
-            Timezone name to assume for naive datetime inputs.
-
-        Returns
-        -------
-        str
-            ISO string like "YYYY-MM-DDTHH:MM:SS".
-        """
-        if isinstance(dt, str):
-            return dt
-        if isinstance(dt, _dt.date) and not isinstance(dt, _dt.datetime):
-            # Interpret date as local midnight start
-            dt = _dt.datetime.combine(dt, _dt.time(0, 0, 0))
-        if isinstance(dt, _dt.datetime):
-            if dt.tzinfo is None:
-                if ZoneInfo is not None:
-                    dt = dt.replace(tzinfo=ZoneInfo(assume_tz))
-            else:
-                if ZoneInfo is not None:
-                    dt = dt.astimezone(ZoneInfo(assume_tz))
-
-            return dt.strftime("%Y-%m-%dT%H:%M:%S")
-        raise TypeError(f"Unsupported dt type: {type(dt)!r}")
-
-
-    @staticmethod
-    def _validate_bbox(bbox: BBox) -> None:
-        min_lat, min_lon, max_lat, max_lon = bbox
-        if not (-90.0 <= min_lat <= 90.0 and -90.0 <= max_lat <= 90.0):
-            raise ValueError("Latitude must be in [-90, 90].")
-        if not (-180.0 <= min_lon <= 180.0 and -180.0 <= max_lon <= 180.0):
-            raise ValueError("Longitude must be in [-180, 180].")
-        if max_lat <= min_lat or max_lon <= min_lon:
-            raise ValueError("Invalid bbox: require max_lat>min_lat and max_lon>min_lon.")
-
-    @staticmethod
-    def _validate_radius(radius: Radius) -> None:
-        lat, lon, r_km = radius
-        if not (-90.0 <= lat <= 90.0) or not (-180.0 <= lon <= 180.0):
-            raise ValueError("Center (lat, lon) out of range.")
-        if r_km <= 0:
-            raise ValueError("Radius (km) must be positive.")
+    # ---------- Time / validation helpers ----------
+    _to_iso8601 = staticmethod(_to_iso8601)
+    _validate_bbox = staticmethod(_validate_bbox)
+    _validate_radius = staticmethod(_validate_radius)
 
     # ---------- HTTP helper ----------
     def _get_json(self, url: str, params: Dict[str, Any]) -> List[Dict[str, Any]]:
-        client = self._ensure_client()
-        self._logger.debug("GET %s params=%s", url, params)
-        try:
-            resp = client.get(url, params=params)
-        except httpx.RequestError as e:
-            raise RuntimeError(f"AFAD request error: {e!r}") from e
-
-        if resp.status_code != 200:
-            # AFAD sometimes returns text/html messages for invalid params
-            raise RuntimeError(
-                f"AFAD HTTP {resp.status_code}: {resp.text[:300]}"
-            )
-        if resp.status_code == 204:
-            return []
+        if self._cache is None:
+            return _decode_events(self._download(url, params))
 
-        # The endpoint typically returns a JSON array of events.
+        cached = self._cache.get(url, params)
+        if cached is not None:
+            self._logger.debug("Cache hit for %s params=%s", url, params)
+            return cached
         try:
-            data = resp.json()
-        except ValueError as e:
-            raise RuntimeError(f"AFAD returned non-JSON payload: {resp.text[:300]}") from e
-
-        if isinstance(data, dict) and "data" in data:
-            # Defensive: in case it's wrapped
-            return data["data"]  # type: ignore[return-value]
-        if isinstance(data, list):
-            return data  # type: ignore[return-value]
+            items = _decode_events(self._download(url, params))
+        except RuntimeError as e:
+            # stale-if-error: an expired entry beats no data when AFAD is down.
+            stale = self._cache.get(url, params, allow_stale=True)
+            if stale is None:
+                raise
+            self._logger.warning("%s; serving stale cached response for %s", e, url)
+            return stale
+        self._cache.put(url, params, items)
+        return items
 
-        raise RuntimeError(f"Unexpected AFAD response type: {type(data)!r}")
+    def _download(self, url: str, params: Dict[str, Any]) -> bytearray:
+        """GET `url` and return the raw 200 body, retrying transient errors."""
+        client = self._ensure_client()
+        self._logger.debug("GET %s params=%s", url, params)
+        # Encode URL, query and headers once; retries resend the same request.
+        request = client.build_request("GET", url, params=params)
+        body: Optional[bytearray] = None
+        for attempt in range(MAX_RETRIES + 1):
+            if self._limiter is not None:
+                time.sleep(self._limiter.reserve())
+            try:
+                resp = client.send(request, stream=True)
+                try:
+                    if resp.status_code == 200:
+                        # Stream into one growing buffer and decode it in place, rather
+                        # than joining chunks into a second full-size bytes object.
+                        body = bytearray()
+                        for chunk in resp.iter_bytes(STREAM_CHUNK_SIZE):
+                            body.extend(chunk)
+                    else:
+                        resp.read()
+                finally:
+                    resp.close()
+            except (httpx.ConnectError, httpx.ConnectTimeout) as e:
+                # Nothing was sent, so one resend is safe (e.g. a pooled socket reset).
+                if attempt > 0:
+                    raise RuntimeError(f"AFAD request error: {e!r}") from e
+                self._logger.warning("AFAD connect error %r; retrying", e)
+                continue
+            except httpx.RequestError as e:
+                raise RuntimeError(f"AFAD request error: {e!r}") from e
+            if body is not None:
+                break
+            # Throttling and gateway errors are usually transient: back off and
+            # retry on the same pooled connection; anything else fails at once.
+            if resp.status_code not in RETRY_STATUSES or attempt == MAX_RETRIES:
+                raise _status_error(resp)
+            delay = _retry_delay(attempt, resp)
+            self._logger.warning("AFAD HTTP %d; retrying in %.1fs", resp.status_code, delay)
+            time.sleep(delay)
+        return body
 
     def fetch_by_filter(
         self,
@@ -197,7 +524,7 @@ class AfadAPI:
         orderby: OrderBy = "timedesc",
         limit: Optional[int] = None,
         # Spatial filters (choose one style):
-        bbox: Optional[BBox] = None,          # (min_lat, min_lon, max_lat, max_lon)
+        bbox: Optional[BBoxLike] = None,      # BBox or (min_lat, min_lon, max_lat, max_lon)
         radius: Optional[Radius] = None,      # (lat, lon, radius_km)
         # Direct parameter pass-through (advanced):
         extra_params: Optional[Dict[str, Any]] = None,
@@ -214,8 +541,8 @@ class AfadAPI:
             Sort order as supported by the service.
         limit : int, optional
             Maximum number of records to return (if supported by the endpoint).
-        bbox : tuple(min_lat, min_lon, max_lat, max_lon), optional
-            Bounding box filter.
+        bbox : BBox | tuple(min_lat, min_lon, max_lat, max_lon), optional
+            Bounding box filter. Tuples are converted to a validated `BBox` once.
         radius : tuple(lat, lon, radius_km), optional
             Radial search filter (in kilometers).
         extra_params : dict, optional
@@ -238,53 +565,21 @@ class AfadAPI:
         >>> len(events)
         42  # for example
         """
-
-        if bbox and radius:
-            raise ValueError("Provide either 'bbox' or 'radius', not both.")
-
-        start_iso = self._to_iso8601(start)
-        end_iso = self._to_iso8601(end)
-
-        params: Dict[str, Any] = {
-            "start": start_iso,
-            "end": end_iso,
-            "orderby": orderby,
-        }
-        if limit is not None:
-            params["limit"] = int(limit)
-
-        # Spatial filters
-        if bbox is not None:
-            self._validate_bbox(bbox)
-            min_lat, min_lon, max_lat, max_lon = bbox
-            # AFAD filter param names (as observed in open-source tooling & examples)
-            params.update({
-                "minlat": min_lat,
-                "maxlat": max_lat,
-                "minlon": min_lon,
-                "maxlon": max_lon,
-            })
-        elif radius is not None:
-            self._validate_radius(radius)
-            lat, lon, r_km = radius
-            # AFAD filter supports circular search with lat/lon and radius.
-            # Some docs mention minrad/maxrad where minrad can be empty (meaning circular).
-            params.update({
-                "lat": lat,
-                "lon": lon,
-                "maxrad": r_km,
-                "minrad": 0,
-            })
-
-        if extra_params:
-            # User-provided params take precedence
-            params.update(extra_params)
+        params = _build_filter_params(
+            start=start,
+            end=end,
+            orderby=orderby,
+            limit=limit,
+            bbox=bbox,
+            radius=radius,
+            extra_params=extra_params,
+        )
 
         url = self._url(ENDPOINT_FILTER)
         items = self._get_json(url, params)
         self._logger.info(
             "Fetched %d events for window %s..%s (orderby=%s)",
-            len(items), start_iso, end_iso, orderby
+            len(items), params["start"], params["end"], orderby
         )
 
         return items
@@ -332,7 +627,7 @@ class AfadAPI:
                 raise
 
             # Fallback: use /event/filter with a recent window (Istanbul time)
-            now = _dt.datetime.now(tz=ZoneInfo(DEFAULT_TZ)) if ZoneInfo else _dt.datetime.now()
+            now = _dt.datetime.now(tz=_TZ)
             start_dt = now - _dt.timedelta(hours=window_hours)
 
             start_iso = self._to_iso8601(start_dt)
@@ -347,4 +642,459 @@ class AfadAPI:
                 end=end_iso,
                 orderby="timedesc",
                 limit=limit,
-            )
\ No newline at end of file
+            )
+
+    def fetch_many(
+        self,
+        windows: Iterable[Window],
+        *,
+        max_concurrency: int = 10,
+        async_client: Optional[httpx.AsyncClient] = None,
+        **shared: Any,
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Fetch several (start, end) windows concurrently; blocking.
+
+        Convenience for callers who do not want to write async code: runs
+        `AsyncAfadAPI.fetch_many_sync` with this client's base URL, timeout,
+        response cache and rate limit. Not callable from inside a running event loop.
+
+        The sync `httpx.Client` passed to `AfadAPI(client=...)` cannot be used
+        here; without `async_client` the windows go through a default
+        `httpx.AsyncClient` (environment proxies apply, but not that client's
+        headers, auth or verify settings).
+
+        Parameters
+        ----------
+        windows : iterable of (start, end)
+            Time windows; each bound accepts the same types as `fetch_by_filter`.
+        max_concurrency : int, optional
+            Maximum number of requests in flight at once (default 10).
+        async_client : httpx.AsyncClient, optional
+            Configured async client to send the requests with; left open afterwards.
+        shared :
+            Keyword arguments applied to every window (orderby, bbox, radius,
+            limit, extra_params).
+
+        Returns
+        -------
+        List[List[Dict[str, Any]]]
+            One event list per window, in the order of `windows`.
+
+        Examples
+        --------
+        >>> start = _dt.datetime(2024, 1, 1)
+        >>> weeks = [(start + _dt.timedelta(weeks=i),
+        ...           start + _dt.timedelta(weeks=i + 1) - _dt.timedelta(seconds=1))
+        ...          for i in range(52)]
+        >>> per_week = api.fetch_many(weeks, orderby="timedesc")
+        """
+        aapi = AsyncAfadAPI(
+            base_url=self.base_url,
+            timeout=self.timeout,
+            max_concurrency=max_concurrency,
+            client=async_client,
+            cache=self._cache,
+            limiter=self._limiter,
+        )
+        return aapi.fetch_many_sync(windows, **shared)
+
+
+class AsyncAfadAPI:
+    """
+    Asynchronous AFAD client for fetching many time windows concurrently.
+
+    Mirrors `AfadAPI.fetch_by_filter` on top of `httpx.AsyncClient`, so a
+    year of daily windows costs roughly (N / max_concurrency) round-trips
+    instead of N sequential ones.
+
+    Parameters
+    ----------
+    base_url : str, optional
+        Base host, same meaning as in `AfadAPI`.
+    timeout : float, optional
+        HTTP timeout in seconds.
+    max_concurrency : int, optional
+        Maximum number of requests in flight at once (default 10).
+    client : httpx.AsyncClient, optional
+        An existing async client. If not provided, a new client will be created.
+    cache_dir, cache_ttl : optional
+        On-disk response cache, same meaning as in `AfadAPI`.
+    rps : float, optional
+        Rate limit in requests per second, as in `AfadAPI`; applies on top of
+        `max_concurrency`.
+    cache, limiter : optional
+        An existing response cache / rate limiter to share (as `AfadAPI.fetch_many`
+        does with its own); take precedence over `cache_dir` / `rps`.
+
+    Examples
+    --------
+    >>> from api import AsyncAfadAPI
+    >>> api = AsyncAfadAPI(max_concurrency=8)
+    >>> windows = [("2025-01-01T00:00:00", "2025-01-01T23:59:59"),
+    ...            ("2025-01-02T00:00:00", "2025-01-02T23:59:59")]
+    >>> per_window = api.fetch_many_sync(windows, orderby="timedesc")
+    >>> [len(items) for items in per_window]
+    [12, 9]  # for example
+    """
+
+    def __init__(
+        self,
+        base_url: str = BASE_URL,
+        timeout: float = DEFAULT_TIMEOUT,
+        max_concurrency: int = 10,
+        client: Optional[httpx.AsyncClient] = None,
+        cache_dir: Optional[Union[str, Path]] = None,
+        cache_ttl: float = DEFAULT_CACHE_TTL,
+        rps: Optional[float] = None,
+        *,
+        cache: Optional[_ResponseCache] = None,
+        limiter: Optional[_RateLimiter] = None,
+    ) -> None:
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be >= 1.")
+        self._logger = get_logger()
+        self.base_url = base_url.rstrip("/")
+        self.timeout = float(timeout)
+        self.max_concurrency = int(max_concurrency)
+        self._client = client  # We'll create one lazily if not provided.
+        self._owns_client = client is None  # only close what we created
+        if cache is None and cache_dir is not None:
+            cache = _ResponseCache(cache_dir, cache_ttl)
+        if limiter is None and rps is not None:
+            limiter = _RateLimiter(rps)
+        self._cache = cache
+        self._limiter = limiter
+
+    # ---------- Lifecycle ----------
+    def _ensure_client(self) -> httpx.AsyncClient:
+        if self._client is None:
+            # No custom transport, so environment proxies still apply (see AfadAPI).
+            self._client = httpx.AsyncClient(
+                timeout=self.timeout,
+                follow_redirects=True,
+                http2=True,
+                limits=httpx.Limits(
+                    max_keepalive_connections=self.max_concurrency,
+                    max_connections=self.max_concurrency * 2,
+                ),
+                headers=DEFAULT_HEADERS,
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the underlying async HTTP client if we created it."""
+        if self._client is not None and self._owns_client:
+            await self._client.aclose()
+            self._client = None
+
+    async def __aenter__(self) -> "AsyncAfadAPI":
+        self._ensure_client()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.aclose()
+
+    # ---------- URL helpers ----------
+    def _url(self, endpoint: str) -> str:
+        return f"{self.base_url}{API_ROOT}{endpoint}"
+
+    # ---------- HTTP helper ----------
+    async def _get_json(self, url: str, params: Dict[str, Any]) -> List[Dict[str, Any]]:
+        if self._cache is None:
+            return _decode_events(await self._download(url, params))
+
+        cached = self._cache.get(url, params)
+        if cached is not None:
+            self._logger.debug("Cache hit for %s params=%s", url, params)
+            return cached
+        try:
+            items = _decode_events(await self._download(url, params))
+        except RuntimeError as e:
+            stale = self._cache.get(url, params, allow_stale=True)
+            if stale is None:
+                raise
+            self._logger.warning("%s; serving stale cached response for %s", e, url)
+            return stale
+        self._cache.put(url, params, items)
+        return items
+
+    async def _download(self, url: str, params: Dict[str, Any]) -> bytearray:
+        """Async version of `AfadAPI._download`."""
+        client = self._ensure_client()
+        self._logger.debug("GET %s params=%s", url, params)
+        request = client.build_request("GET", url, params=params)
+        body: Optional[bytearray] = None
+        for attempt in range(MAX_RETRIES + 1):
+            if self._limiter is not None:
+                await asyncio.sleep(self._limiter.reserve())
+            try:
+                resp = await client.send(request, stream=True)
+                try:
+                    if resp.status_code == 200:
+                        body = bytearray()
+                        async for chunk in resp.aiter_bytes(STREAM_CHUNK_SIZE):
+                            body.extend(chunk)
+                    else:
+                        await resp.aread()
+                finally:
+                    await resp.aclose()
+            except (httpx.ConnectError, httpx.ConnectTimeout) as e:
+                if attempt > 0:
+                    raise RuntimeError(f"AFAD request error: {e!r}") from e
+                self._logger.warning("AFAD connect error %r; retrying", e)
+                continue
+            except httpx.RequestError as e:
+                raise RuntimeError(f"AFAD request error: {e!r}") from e
+            if body is not None:
+                break
+            if resp.status_code not in RETRY_STATUSES or attempt == MAX_RETRIES:
+                raise _status_error(resp)
+            delay = _retry_delay(attempt, resp)
+            self._logger.warning("AFAD HTTP %d; retrying in %.1fs", resp.status_code, delay)
+            await asyncio.sleep(delay)
+        return body
+
+    async def fetch_by_filter_async(
+        self,
+        *,
+        start: TimeLike,
+        end: TimeLike,
+        orderby: OrderBy = "timedesc",
+        limit: Optional[int] = None,
+        bbox: Optional[BBoxLike] = None,
+        radius: Optional[Radius] = None,
+        extra_params: Optional[Dict[str, Any]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Async version of `AfadAPI.fetch_by_filter` (same arguments and result).
+
+        Examples
+        --------
+        >>> async with AsyncAfadAPI() as api:
+        ...     events = await api.fetch_by_filter_async(
+        ...         start="2025-05-13T00:00:00",
+        ...         end="2025-05-13T23:59:59",
+        ...     )
+        """
+        params = _build_filter_params(
+            start=start,
+            end=end,
+            orderby=orderby,
+            limit=limit,
+            bbox=bbox,
+            radius=radius,
+            extra_params=extra_params,
+        )
+
+        url = self._url(ENDPOINT_FILTER)
+        items = await self._get_json(url, params)
+        self._logger.info(
+            "Fetched %d events for window %s..%s (orderby=%s)",
+            len(items), params["start"], params["end"], orderby
+        )
+
+        return items
+
+    async def fetch_many(
+        self,
+        windows: Iterable[Window],
+        **shared: Any,
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Fetch several (start, end) windows concurrently.
+
+        At most `max_concurrency` requests are in flight at once. Results are
+        returned in the same order as `windows`, one event list per window.
+
+        Parameters
+        ----------
+        windows : iterable of (start, end)
+            Time windows; each bound accepts the same types as `fetch_by_filter`.
+        shared :
+            Keyword arguments applied to every window (orderby, bbox, radius,
+            limit, extra_params).
+
+        Returns
+        -------
+        List[List[Dict[str, Any]]]
+        """
+        sem = asyncio.Semaphore(self.max_concurrency)
+
+        async def one(window: Window) -> List[Dict[str, Any]]:
+            start, end = window
+            async with sem:
+                return await self.fetch_by_filter_async(start=start, end=end, **shared)
+
+        return list(await asyncio.gather(*(one(w) for w in windows)))
+
+    async def fetch_all(
+        self,
+        *,
+        start: TimeLike,
+        end: TimeLike,
+        orderby: Literal["timedesc", "timeasc"] = "timedesc",
+        page_size: int = DEFAULT_PAGE_SIZE,
+        max_pages: int = 50,
+        **shared: Any,
+    ) -> List[Dict[str, Any]]:
+        """
+        Fetch every event in [start, end], paging past the server's per-request cap.
+
+        A page that comes back full (`page_size` events) only covers the part
+        of the window up to its oldest event (newest for 'timeasc'). The rest
+        is split into as many sub-windows as the observed event density
+        suggests and fetched concurrently; full sub-windows are split again.
+        Events seen twice at window edges are dropped by event id.
+
+        Parameters
+        ----------
+        start, end : str | datetime | date
+            Window bounds, as in `fetch_by_filter`.
+        orderby : {'timedesc','timeasc'}
+            Result order; paging needs a time ordering.
+        page_size : int, optional
+            `limit` sent with each request; should not exceed the server cap.
+        max_pages : int, optional
+            Upper bound on requests. When reached, a warning is logged and the
+            events fetched so far are returned.
+        shared :
+            Other `fetch_by_filter` arguments (bbox, radius, extra_params).
+
+        Returns
+        -------
+        List[Dict[str, Any]]
+            Raw events in `orderby` order.
+
+        Examples
+        --------
+        >>> async with AsyncAfadAPI() as api:
+        ...     items = await api.fetch_all(start="2023-02-06", end="2023-02-13T23:59:59")
+        """
+        if orderby not in ("timedesc", "timeasc"):
+            raise ValueError("fetch_all requires orderby 'timedesc' or 'timeasc'.")
+        if page_size < 1 or max_pages < 1:
+            raise ValueError("page_size and max_pages must be >= 1.")
+        descending = orderby == "timedesc"
+        sem = asyncio.Semaphore(self.max_concurrency)
+        budget = [max_pages - 1]  # requests left after the first page
+        truncated = [False]
+
+        async def cover(lo: _dt.datetime, hi: _dt.datetime) -> List[List[Dict[str, Any]]]:
+            async with sem:
+                items = await self.fetch_by_filter_async(
+                    start=lo, end=hi, orderby=orderby, limit=page_size, **shared
+                )
+            if len(items) < page_size:
+                return [items]
+
+            times = [t for t in map(_event_time, items) if t is not None]
+            if not times:
+                return [items]
+            # The page holds everything in [edge, hi] (or [lo, edge] ascending);
+            # the edge itself stays in the remainder since it may be split.
+            edge = min(times) if descending else max(times)
+            rest_lo, rest_hi = (lo, edge) if descending else (edge, hi)
+            seen = (hi - edge) if descending else (edge - lo)
+            span = rest_hi - rest_lo
+            if span.total_seconds() < 1:
+                self._logger.warning(
+                    "More than %d events at %s; cannot page further.", page_size, edge
+                )
+                return [items]
+
+            # Estimate pages needed for the remainder from the density just seen.
+            if budget[0] < 1:
+                truncated[0] = True
+                return [items]
+            wanted = math.ceil(span / seen) if seen.total_seconds() > 0 else self.max_concurrency
+            n = max(1, min(wanted, self.max_concurrency, budget[0]))
+            budget[0] -= n
+
+            cuts = [rest_lo + span * i / n for i in range(n + 1)]
+            subs = [(cuts[i].replace(microsecond=0), cuts[i + 1].replace(microsecond=0)) for i in range(n)]
+            if descending:
+                subs.reverse()  # newest sub-window first, matching page order
+            parts = await asyncio.gather(*(cover(a, b) for a, b in subs))
+            return [items] + [chunk for part in parts for chunk in part]
+
+        chunks = await cover(_local_naive(start), _local_naive(end))
+        if truncated[0]:
+            self._logger.warning(
+                "fetch_all stopped after %d requests; results for %s..%s are incomplete.",
+                max_pages, _to_iso8601(start), _to_iso8601(end)
+            )
+
+        events: List[Dict[str, Any]] = []
+        seen_ids = set()
+        for chunk in chunks:
+            for item in chunk:
+                key = _event_id(item)
+                if key is not None:
+                    if key in seen_ids:
+                        continue
+                    seen_ids.add(key)
+                events.append(item)
+        return events
+
+    def fetch_many_sync(
+        self,
+        windows: Iterable[Window],
+        **shared: Any,
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Blocking wrapper around `fetch_many` for non-async callers.
+
+        Runs its own event loop via `asyncio.run`, so it cannot be called from
+        inside a running loop (use `await fetch_many(...)` there instead). A client
+        created internally is bound to that loop and is closed before returning;
+        one passed in as `client=` is left open for the caller to manage.
+        """
+        return self._run_sync(self.fetch_many(windows, **shared))
+
+    def fetch_all_sync(self, **kwargs: Any) -> List[Dict[str, Any]]:
+        """Blocking wrapper around `fetch_all` (see `fetch_many_sync` for caveats)."""
+        return self._run_sync(self.fetch_all(**kwargs))
+
+    def _run_sync(self, coro: Any) -> Any:
+        async def run() -> Any:
+            try:
+                return await coro
+            finally:
+                await self.aclose()
+
+        return asyncio.run(run())
+
+
+def default_api(base_url: str = BASE_URL, **kwargs: Any) -> AfadAPI:
+    """
+    Shared `AfadAPI` for this process, one per distinct set of arguments.
+
+    Scripts and notebooks that use this instead of constructing `AfadAPI`
+    themselves keep one warm connection pool per host. The client is built
+    up front (so worker threads never race to create it) and closed at exit.
+
+    Parameters
+    ----------
+    base_url : str, optional
+        Base host, as in `AfadAPI`.
+    kwargs :
+        Other `AfadAPI` arguments (timeout, cache_dir, cache_ttl, rps).
+
+    Examples
+    --------
+    >>> api = default_api("https://servisnet.afad.gov.tr/apigateway/deprem")
+    >>> api is default_api("https://servisnet.afad.gov.tr/apigateway/deprem")
+    True
+    """
+    # lru_cache keys on how a call is spelled; normalize so that default_api(),
+    # default_api(BASE_URL) and default_api(base_url=BASE_URL + "/") share one entry.
+    return _default_api(base_url.rstrip("/"), tuple(sorted(kwargs.items())))
+
+
+@functools.lru_cache(maxsize=None)
+def _default_api(base_url: str, kwargs: Tuple[Tuple[str, Any], ...]) -> AfadAPI:
+    api = AfadAPI(base_url=base_url, **dict(kwargs))
+    api._ensure_client()
+    atexit.register(api.close)
+    return api
@@ -18,6 +18,20 @@ ALT_GATEWAY_HINT = "https://servisnet.afad.gov.tr/apigateway/deprem"
 # Time / timezone
 DEFAULT_TZ = "Europe/Istanbul"
 DEFAULT_TIMEOUT = 15.0  # seconds
+DEFAULT_PAGE_SIZE = 1000  # events per /event/filter request when paging
+
+# Retries for transient HTTP errors (throttling, gateway hiccups)
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+MAX_RETRIES = 3
+RETRY_BACKOFF = 0.3  # seconds before the first retry; doubles on each attempt
+MAX_RETRY_AFTER = 60.0  # cap on any single wait, including a server Retry-After
+
+# Mean Earth radius for great-circle distances
+EARTH_RADIUS_KM = 6371.0
+
+# Optional on-disk response cache
+DEFAULT_CACHE_TTL = 3600.0  # seconds, for windows that may still change
+CACHE_SETTLED_AFTER_DAYS = 7  # windows ending earlier than this never expire
 
 # Canonical column names we aim to deliver in DataFrames (present even if null)
 CANONICAL_FIELDS = [
@@ -37,3 +51,23 @@ CANONICAL_FIELDS = [
     "is_event_update",
     "last_update_time",
 ]
+
+# Raw AFAD keys observed for each canonical column, in order of preference.
+# The first alias with a non-null value wins when several are present.
+ALIAS_MAP = {
+    "event_id": ("eventid", "eventId", "eventID", "id"),
+    "time": ("time", "date", "datetime", "eventDate", "lastOccurrenceTime"),
+    "latitude": ("latitude", "lat"),
+    "longitude": ("longitude", "lon", "lng"),
+    "depth_km": ("depth_km", "depth"),
+    "magnitude": ("magnitude", "mag"),
+    "mag_type": ("type", "magType"),
+    "location": ("location", "title", "place"),
+    "province": ("province", "il"),
+    "district": ("district", "ilce"),
+    "country": ("country",),
+    "neighborhood": ("neighborhood", "mahalle"),
+    "rms": ("rms",),
+    "is_event_update": ("iseventupdate", "isEventUpdate"),
+    "last_update_time": ("lastupdatedate", "lastUpdate", "last_update_time"),
+}
@@ -1,13 +1,60 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List, Literal, Optional, Sequence
+import warnings
+from typing import Any, Dict, List, Literal, Optional, Sequence, Tuple
+from zoneinfo import ZoneInfo
 
 import pandas as pd
 import numpy as np
 
-from constants import CANONICAL_FIELDS, DEFAULT_TZ
+from constants import ALIAS_MAP, CANONICAL_FIELDS, DEFAULT_TZ, EARTH_RADIUS_KM
+from geom import BBox, BBoxLike
 from logger import get_logger
 
+# All day bucketing and date filters happen in this zone; resolve it once.
+_TZ = ZoneInfo(DEFAULT_TZ)
+
+
+def _energy_joules(magnitude: pd.Series, a: float, b: float) -> np.ndarray:
+    """E[J] = 10 ** (a + b*M) in one pass over the magnitudes (NaN → NaN)."""
+    from _kernels import energy_from_mag  # deferred: may import/compile numba
+
+    m = pd.to_numeric(magnitude, errors="coerce").to_numpy(dtype=np.float64)
+    out = np.empty_like(m)
+    energy_from_mag(m, a, b, out)
+    return out
+
+
+def _bbox_from_radius(
+    lat: float, lon: float, km: float
+) -> Tuple[Tuple[float, float], Optional[Tuple[float, float]]]:
+    """
+    Smallest lat/lon box containing the circle of `km` around (lat, lon).
+
+    Returns ((min_lat, max_lat), (min_lon, max_lon)); the longitude range is
+    None when the circle reaches a pole or crosses the antimeridian, where a
+    single lon interval cannot bound it.
+    """
+    delta = km / EARTH_RADIUS_KM  # angular radius, radians
+    dlat = np.degrees(delta)
+    lat_range = (max(lat - dlat, -90.0), min(lat + dlat, 90.0))
+    if lat - dlat <= -90.0 or lat + dlat >= 90.0:
+        return lat_range, None
+    # Widest longitude offset on the circle (not simply at the center latitude).
+    dlon = np.degrees(np.arcsin(np.sin(delta) / np.cos(np.radians(lat))))
+    if lon - dlon < -180.0 or lon + dlon > 180.0:
+        return lat_range, None
+    return lat_range, (lon - dlon, lon + dlon)
+
+
+def _haversine_km(lat: float, lon: float, lats: np.ndarray, lons: np.ndarray) -> np.ndarray:
+    """Great-circle distance in km from (lat, lon) to each (lats[i], lons[i])."""
+    from _kernels import haversine_km  # deferred: may import/compile numba
+
+    out = np.empty_like(lats)
+    haversine_km(lat, lon, lats, lons, EARTH_RADIUS_KM, out)
+    return out
+
 
 class EarthquakeDataset:
     """
@@ -15,10 +62,10 @@ class EarthquakeDataset:
 
     Key features:
     - Normalize raw records to a canonical schema (columns always exist, may be null).
-    - Client-side filters (date/magnitude/depth/mag_type).
+    - Client-side filters (date/magnitude/depth/radius/mag_type).
     - Energy conversion: E[J] = 10 ^ (a + b * M), defaults a=1.44, b=5.24.
     - Daily aggregations with options (one row per day if requested).
-    - Single save() for CSV/JSON.
+    - Single save() for CSV/JSON/JSON Lines/Parquet.
 
     Parameters
     ----------
@@ -40,11 +87,29 @@ class EarthquakeDataset:
         self._logger = get_logger()
         self._raw = records or []
         self._df: Optional[pd.DataFrame] = None  # built lazily
+        # True while no caller outside this class can hold a reference to _df,
+        # i.e. while it is safe to add columns in place without copying.
+        self._df_owned = False
+        # Row bounds recorded by filter_by_date/_magnitude/_depth, keyed by
+        # column as [low, high]; applied together as one mask on next access.
+        self._pending: Dict[str, List[Any]] = {}
+        # Circles (lat, lon, km) from filter_by_radius, applied with the bounds.
+        self._circles: List[Tuple[float, float, float]] = []
 
     # ------------- Constructors -------------
     @classmethod
     def from_records(cls, records: List[Dict[str, Any]]) -> "EarthquakeDataset":
-        """Create dataset from raw AFAD records."""
+        """
+        Create dataset from raw AFAD records.
+
+        The dataset releases `records` once its DataFrame is built; pass the
+        fetch result directly (not via a long-lived variable) to let the raw
+        dicts be garbage-collected then.
+
+        Examples
+        --------
+        >>> ds = EarthquakeDataset.from_records(api.fetch_by_filter(start=..., end=...))
+        """
         return cls(records)
 
     # ------------- Core -------------
@@ -56,40 +121,77 @@ class EarthquakeDataset:
         - Parses 'time' to tz-aware Europe/Istanbul.
         - Casts numeric fields to float where applicable.
         """
-        if self._df is not None:
-            return self._df
+        df = self._frame()
+        # The caller now shares this frame; later in-place writes must copy first.
+        self._df_owned = False
+        return df
+
+    def _frame(self) -> pd.DataFrame:
+        """Internal access to the working DataFrame (built once, not handed out)."""
+        if self._df is None:
+            self._set_frame(self._build_frame())
+            # The frame now holds the data; drop our reference to the raw dicts
+            # (typically several times the frame's size) so they can be freed.
+            self._raw = []
+        if self._pending or self._circles:
+            self._apply_filters()
+        return self._df
 
-        rows: List[Dict[str, Any]] = [self._normalize_record(r) for r in self._raw]
-        df = pd.DataFrame(rows)
+    def _build_frame(self) -> pd.DataFrame:
+        """Build the canonical DataFrame from the raw records."""
+        df = self._normalize_frame(pd.DataFrame(self._raw))
 
         # Ensure canonical columns exist even if missing in data
         for col in CANONICAL_FIELDS:
             if col not in df.columns:
                 df[col] = np.nan
 
-        # Coerce numeric types
+        # Coerce numeric types. Columns the constructor already typed as float
+        # (JSON numbers, or all-missing) need no second pass.
         for col in ("latitude", "longitude", "depth_km", "magnitude", "rms"):
-            if col in df.columns:
+            if not pd.api.types.is_float_dtype(df[col].dtype):
                 df[col] = pd.to_numeric(df[col], errors="coerce")
 
+        # Low-cardinality labels → category: integer codes instead of one Python
+        # string per cell, and isin/groupby work on the codes.
+        for col in ("mag_type", "province", "district", "country", "neighborhood"):
+            df[col] = df[col].astype("category")
+
         # Parse time → Europe/Istanbul (tz-aware)
         if "time" in df.columns:
-            t = pd.to_datetime(df["time"], errors="coerce", utc=False)
+            # Explicit ISO8601 keeps pandas on its fast C parser instead of
+            # per-element format inference. utc stays False: naive AFAD times
+            # are Istanbul wall time, not UTC.
+            t = self._parse_times(df["time"])
             # If tz-naive → localize to DEFAULT_TZ; if tz-aware → convert.
             if getattr(t.dt, "tz", None) is None:
-                t = t.dt.tz_localize(DEFAULT_TZ)
+                t = t.dt.tz_localize(_TZ)
             else:
-                t = t.dt.tz_convert(DEFAULT_TZ)
+                t = t.dt.tz_convert(_TZ)
             df["time"] = t
 
         # Order columns: canonical first, then the rest
         other_cols = [c for c in df.columns if c not in CANONICAL_FIELDS]
-        df = df[CANONICAL_FIELDS + other_cols]
+        return df[CANONICAL_FIELDS + other_cols]
 
-        self._df = df
-        return self._df
+    def _set_frame(self, df: pd.DataFrame, *, owned: bool = True) -> None:
+        """
+        Replace the working DataFrame and record whether we solely own it.
+
+        Filters pass the parent's flag: pandas < 3 tracks a row subset as a slice
+        of a frame the caller may still hold, so writing to it would warn.
+        """
+        if df is not self._df:
+            self._df = df
+            self._df_owned = owned
 
-    def save(self, path: str, *, fmt: Literal["csv", "json"] = "csv", **kwargs) -> "EarthquakeDataset":
+    def save(
+        self,
+        path: str,
+        *,
+        fmt: Literal["csv", "json", "jsonl", "parquet"] = "csv",
+        **kwargs,
+    ) -> "EarthquakeDataset":
         """
         Save the current DataFrame to disk.
 
@@ -97,25 +199,38 @@ class EarthquakeDataset:
         ----------
         path : str
             File path.
-        fmt : {'csv','json'}
-            Output format.
+        fmt : {'csv','json','jsonl','parquet'}
+            Output format. 'jsonl' writes one JSON record per line; 'parquet'
+            requires pyarrow (or fastparquet) and defaults to zstd compression.
         kwargs :
             Passed to pandas writer. For JSON, defaults to orient='records', date_format='iso'.
 
         Examples
         --------
         >>> ds.convert_energy().aggregate_daily("daily_energy_sum", fill_empty_days=True).save("quakes.json", fmt="json")
+        >>> ds.save("quakes.parquet", fmt="parquet")
         """
-        df = self.to_dataframe().copy()
+        df = self._frame()
         if fmt == "csv":
+            if "date_format" not in kwargs:
+                df = self._csv_dates(df)
             df.to_csv(path, index=False, encoding=kwargs.pop("encoding", "utf-8"), **kwargs)
-        elif fmt == "json":
+        elif fmt in ("json", "jsonl"):
             kwargs.setdefault("orient", "records")
             kwargs.setdefault("date_format", "iso")
             kwargs.setdefault("force_ascii", False)
+            if fmt == "jsonl":
+                kwargs["lines"] = True
+            # orient="table" records dtypes in its schema, so leave it untouched.
+            if (kwargs["date_format"] == "iso" and kwargs.get("date_unit", "ms") == "ms"
+                    and kwargs["orient"] != "table"):
+                df = self._iso_dates(df)
             df.to_json(path, **kwargs)
+        elif fmt == "parquet":
+            kwargs.setdefault("compression", "zstd")
+            df.to_parquet(path, index=False, **kwargs)
         else:
-            raise ValueError("fmt must be 'csv' or 'json'")
+            raise ValueError("fmt must be 'csv', 'json', 'jsonl' or 'parquet'")
         return self
 
     # ------------- Filters (in-place; chainable) -------------
@@ -132,15 +247,11 @@ class EarthquakeDataset:
         --------
         >>> ds.filter_by_date(start="2025-08-01 00:00:00", end="2025-08-07 23:59:59")
         """
-        df = self.to_dataframe()
-        t = df["time"]
-        if start is not None:
-            s = pd.Timestamp(start, tz=DEFAULT_TZ)
-            df = df[t >= s]
-        if end is not None:
-            e = pd.Timestamp(end, tz=DEFAULT_TZ)
-            df = df[t <= e]
-        self._df = df
+        self._add_bounds(
+            "time",
+            None if start is None else self._utc64(start),
+            None if end is None else self._utc64(end),
+        )
         return self
 
     def filter_by_magnitude(
@@ -156,13 +267,11 @@ class EarthquakeDataset:
         --------
         >>> ds.filter_by_magnitude(min_mag=5.0)
         """
-        df = self.to_dataframe()
-        mag = df["magnitude"]
-        if min_mag is not None:
-            df = df[mag >= float(min_mag)]
-        if max_mag is not None:
-            df = df[mag <= float(max_mag)]
-        self._df = df
+        self._add_bounds(
+            "magnitude",
+            None if min_mag is None else float(min_mag),
+            None if max_mag is None else float(max_mag),
+        )
         return self
 
     def filter_by_depth(
@@ -178,13 +287,53 @@ class EarthquakeDataset:
         --------
         >>> ds.filter_by_depth(min_depth_km=0, max_depth_km=70)
         """
-        df = self.to_dataframe()
-        d = df["depth_km"]
-        if min_depth_km is not None:
-            df = df[d >= float(min_depth_km)]
-        if max_depth_km is not None:
-            df = df[d <= float(max_depth_km)]
-        self._df = df
+        self._add_bounds(
+            "depth_km",
+            None if min_depth_km is None else float(min_depth_km),
+            None if max_depth_km is None else float(max_depth_km),
+        )
+        return self
+
+    def filter_by_radius(
+        self,
+        *,
+        lat: float,
+        lon: float,
+        radius_km: float,
+    ) -> "EarthquakeDataset":
+        """
+        Keep rows whose epicenter lies within `radius_km` of (lat, lon).
+
+        Rows outside the circle's bounding box are dropped by plain lat/lon
+        comparisons first; great-circle distances are computed only for the rest.
+
+        Examples
+        --------
+        >>> ds.filter_by_radius(lat=38.4237, lon=27.1428, radius_km=200.0)  # İzmir
+        """
+        if radius_km <= 0:
+            raise ValueError("radius_km must be positive.")
+        lat_range, lon_range = _bbox_from_radius(float(lat), float(lon), float(radius_km))
+        self._add_bounds("latitude", *lat_range)
+        if lon_range is not None:
+            self._add_bounds("longitude", *lon_range)
+        self._circles.append((float(lat), float(lon), float(radius_km)))
+        return self
+
+    def filter_by_bbox(self, bbox: BBoxLike) -> "EarthquakeDataset":
+        """
+        Keep rows whose epicenter lies inside `bbox` (bounds inclusive).
+
+        Accepts a `BBox` or a (min_lat, min_lon, max_lat, max_lon) tuple. The bounds
+        join the pending lat/lon mask, so chained filters still cost one pass.
+
+        Examples
+        --------
+        >>> ds.filter_by_bbox(BBox(36.0, 26.0, 40.0, 29.5))  # Western Turkey
+        """
+        box = BBox.coerce(bbox)
+        self._add_bounds("latitude", box.min_lat, box.max_lat)
+        self._add_bounds("longitude", box.min_lon, box.max_lon)
         return self
 
     def filter_by_mag_type(
@@ -200,14 +349,18 @@ class EarthquakeDataset:
         --------
         >>> ds.filter_by_mag_type(allowed=["Mw"])
         """
-        df = self.to_dataframe()
-        col = df["mag_type"].astype("string")
+        df = self._frame()
+        col = df["mag_type"]
+        if not isinstance(col.dtype, pd.CategoricalDtype):
+            col = col.astype("category")
         if case_insensitive:
+            # Lower-case the handful of categories, not every row.
             allowed_set = {a.lower() for a in allowed}
-            mask = col.str.lower().isin(allowed_set)
+            cats = col.cat.categories
+            mask = col.isin(cats[cats.astype(str).str.lower().isin(allowed_set)])
         else:
             mask = col.isin(allowed)
-        self._df = df[mask]
+        self._set_frame(df[mask], owned=self._df_owned)
         return self
 
     # ------------- Energy -------------
@@ -235,11 +388,11 @@ class EarthquakeDataset:
         >>> ds.convert_energy()               # defaults: a=1.44, b=5.24 → E[J]
         >>> ds.convert_energy(out_col="E")    # write to a custom column
         """
-        df = self.to_dataframe().copy()
-        m = pd.to_numeric(df["magnitude"], errors="coerce")
-        e = np.where(m.notna(), np.power(10.0, a + b * m), np.nan)
-        df[out_col] = e
-        self._df = df
+        df = self._frame()
+        if not self._df_owned:
+            df = df.copy()
+        df[out_col] = _energy_joules(df["magnitude"], a, b)
+        self._set_frame(df)
         return self
 
     # ------------- Daily aggregation -------------
@@ -283,35 +436,51 @@ class EarthquakeDataset:
         if mode == "all_events":
             return self
 
-        df = self.to_dataframe().copy()
+        # No defensive copy: assign() below already returns a new frame, so the
+        # working frame is never written to.
+        df = self._frame()
 
-        # Define day key in Istanbul TZ
-        day = df["time"].dt.tz_convert(DEFAULT_TZ).dt.floor("D")
-        df = df.assign(__day=day)
+        # Define day key in Istanbul TZ as an integer day code: grouping and
+        # comparing int64 is cheaper than datetimes, and only the distinct days
+        # are turned back into timestamps at the end.
+        t = df["time"]
+        if t.dt.tz is None or str(t.dt.tz) != str(_TZ):
+            t = t.dt.tz_convert(_TZ)
+        unit = t.dt.unit
+        valid = t.notna().to_numpy()
+        if not valid.all():
+            # NaT rows have no day (groupby would drop them anyway)
+            df, t = df[valid], t[valid]
+        df = df.assign(__day=self._day_codes(t))
 
         # Optional date window for aggregation
         if start is not None:
-            s = pd.Timestamp(start, tz=DEFAULT_TZ).floor("D")
-            df = df[df["__day"] >= s]
+            df = df[df["__day"] >= self._day_code(start)]
         if end is not None:
-            e = pd.Timestamp(end, tz=DEFAULT_TZ).floor("D")
-            df = df[df["__day"] <= e]
+            df = df[df["__day"] <= self._day_code(end)]
 
         def _ensure_energy(local_df: pd.DataFrame) -> pd.DataFrame:
             if energy_col not in local_df.columns:
                 # compute with defaults if not present
-                m = pd.to_numeric(local_df["magnitude"], errors="coerce")
-                local_df[energy_col] = np.where(m.notna(), np.power(10.0, 1.44 + 5.24 * m), np.nan)
+                local_df[energy_col] = _energy_joules(local_df["magnitude"], 1.44, 5.24)
             return local_df
 
+        def _daily_max_rows(local_df: pd.DataFrame) -> pd.DataFrame:
+            # One sort instead of groupby-idxmax + label gather: per day, the
+            # largest magnitude comes first (earliest row wins ties, NaN last).
+            ordered = local_df.sort_values(
+                ["__day", "magnitude"], ascending=[True, False], na_position="last"
+            )
+            return ordered.drop_duplicates("__day", keep="first").copy()
+
         result: pd.DataFrame
 
         if mode == "daily_max_mag":
-            idx = df.groupby("__day")["magnitude"].idxmax()
-            result = df.loc[idx, :].copy()
-            result["event_count"] = df.groupby("__day")["event_id"].transform("count").loc[idx].values
+            result = _daily_max_rows(df)
+            counts = df.groupby("__day", sort=False)["event_id"].count()
+            result["event_count"] = result["__day"].map(counts).values
             # Normalize 'time' to day 00:00
-            result["time"] = result["__day"]
+            result["time"] = self._day_starts(result["__day"], unit)
             result = result.drop(columns=["__day"])
 
         elif mode == "daily_mag_threshold":
@@ -322,10 +491,10 @@ class EarthquakeDataset:
                 # construct empty daily frame later with fill_empty_days
                 result = sub.copy()
             else:
-                idx = sub.groupby("__day")["magnitude"].idxmax()
-                result = sub.loc[idx, :].copy()
-                result["event_count"] = df.groupby("__day")["event_id"].size().reindex(result["__day"]).values
-                result["time"] = result["__day"]
+                result = _daily_max_rows(sub)
+                counts = df.groupby("__day", sort=False)["event_id"].size()
+                result["event_count"] = result["__day"].map(counts).values
+                result["time"] = self._day_starts(result["__day"], unit)
                 result = result.drop(columns=["__day"])
 
         elif mode in ("daily_energy_sum", "daily_energy_max"):
@@ -338,15 +507,8 @@ class EarthquakeDataset:
                 magnitude=("magnitude", "max"),  # keep daily max magnitude as reference
             ).reset_index(names="time")
 
-            result = out.copy()
-            ts = pd.to_datetime(result["time"], utc=False)
-
-            # Ensure tz-aware 'time'
-            if getattr(ts.dt, "tz", None) is None:
-                ts = ts.dt.tz_localize(DEFAULT_TZ)
-            else:
-                ts = ts.dt.tz_convert(DEFAULT_TZ)
-            result["time"] = ts
+            result = out
+            result["time"] = self._day_starts(result["time"], unit)
 
         else:
             raise ValueError(f"Unknown mode: {mode}")
@@ -355,61 +517,186 @@ class EarthquakeDataset:
         if fill_empty_days:
 
             if start is None:
-                start_day = (
-                    (df["__day"].min() if not df.empty else pd.Timestamp.now(tz=DEFAULT_TZ))
-                    .floor("D")
-                )
+                start_day = int(df["__day"].min()) if not df.empty else self._day_code(pd.Timestamp.now(tz=_TZ))
             else:
-                start_day = pd.Timestamp(start, tz=DEFAULT_TZ).floor("D")
+                start_day = self._day_code(start)
             if end is None:
-                end_day = (
-                    (df["__day"].max() if not df.empty else start_day)
-                    .floor("D")
-                )
+                end_day = int(df["__day"].max()) if not df.empty else start_day
             else:
-                end_day = pd.Timestamp(end, tz=DEFAULT_TZ).floor("D")
+                end_day = self._day_code(end)
 
-            full_idx = pd.date_range(start=start_day, end=end_day, freq="D", tz=DEFAULT_TZ)
-            result = result.set_index("time").reindex(full_idx).rename_axis("time").reset_index()
+            # Same resolution as 'time' so the merge keys compare directly.
+            full_idx = self._day_starts(np.arange(start_day, end_day + 1), result["time"].dt.unit)
+            # One left merge onto the full day range (instead of set_index →
+            # reindex → reset_index), then fill the gaps in place.
+            result = pd.DataFrame({"time": full_idx}).merge(result, on="time", how="left")
 
-            # Empty-day defaults
+            # Empty-day defaults; magnitude stays NaN for empty days
+            fill: Dict[str, Any] = {"event_count": 0}
             if "energy_J" in result.columns:
-                result["energy_J"] = result["energy_J"].fillna(0.0)
-            result["event_count"] = result.get("event_count", pd.Series(index=result.index)).fillna(0).astype(int)
-            if "magnitude" in result.columns:
-                # magnitude stays NaN for empty days
-                pass
+                fill["energy_J"] = 0.0
+            if "event_count" not in result.columns:
+                result["event_count"] = 0
+            result.fillna(fill, inplace=True)
+            result["event_count"] = result["event_count"].astype(np.int64)
 
         # Keep canonical columns if present; otherwise return what we have
-        self._df = result
+        self._set_frame(result)
         return self
 
     # ------------- Helpers -------------
+    def _add_bounds(self, col: str, low: Any, high: Any) -> None:
+        """Record [low, high] for `col`, narrowing any bounds already pending."""
+        cur_low, cur_high = self._pending.get(col, [None, None])
+        if low is not None and (cur_low is None or low > cur_low):
+            cur_low = low
+        if high is not None and (cur_high is None or high < cur_high):
+            cur_high = high
+        if cur_low is not None or cur_high is not None:
+            self._pending[col] = [cur_low, cur_high]
+
+    def _apply_filters(self) -> None:
+        """Apply all pending bounds and circles to the working frame with a single row mask."""
+        bounds, self._pending = self._pending, {}
+        circles, self._circles = self._circles, []
+        df = self._df
+        mask = np.ones(len(df), dtype=bool)
+        for col, (low, high) in bounds.items():
+            # float64 for numeric columns; naive UTC datetime64 for tz-aware time.
+            # NaN/NaT compare False, so missing values are dropped as before.
+            values = df[col].values
+            if low is not None:
+                mask &= values >= low
+            if high is not None:
+                mask &= values <= high
+        if circles:
+            lats = df["latitude"].to_numpy(dtype=np.float64)
+            lons = df["longitude"].to_numpy(dtype=np.float64)
+            for lat, lon, km in circles:
+                # Distances only for rows that survived the bounding boxes.
+                idx = np.flatnonzero(mask)
+                dist = _haversine_km(lat, lon, lats[idx], lons[idx])
+                mask[idx[~(dist <= km)]] = False  # NaN distance is dropped too
+        if not mask.all():
+            self._set_frame(df[mask], owned=self._df_owned)
+
+    @staticmethod
+    def _parse_times(s: pd.Series) -> pd.Series:
+        """
+        Parse ISO8601 times, tolerating a mix of naive and offset-bearing values.
+
+        pandas will not mix the two even with errors="coerce" (3.x raises, 2.x falls
+        back to object dtype); this happens when raw lists from different sources
+        are concatenated. In that case parse everything as UTC and re-read the
+        naive rows as Istanbul wall time.
+        """
+        try:
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore", FutureWarning)
+                t = pd.to_datetime(s, errors="coerce", utc=False, format="ISO8601", cache=True)
+            if pd.api.types.is_datetime64_any_dtype(t.dtype):
+                return t
+        except ValueError:
+            pass
+        t = pd.to_datetime(s, errors="coerce", utc=True, format="ISO8601", cache=True).dt.tz_convert(_TZ)
+        naive = ~s.astype("string").str.contains(r"(?:Z|[+-]\d{2}:?\d{2})$", na=True)
+        if naive.any():
+            wall = t[naive].dt.tz_convert("UTC").dt.tz_localize(None).dt.tz_localize(_TZ)
+            t = t.mask(naive, wall)
+        return t
+
     @staticmethod
-    def _normalize_record(r: Dict[str, Any]) -> Dict[str, Any]:
-        """Map heterogeneous AFAD keys to our canonical schema."""
-        def g(*names: str) -> Any:
-            for n in names:
-                if n in r:
-                    return r[n]
-            return None
-
-        out = {
-            "event_id": g("eventid", "eventId", "eventID", "id"),
-            "time": g("time", "date", "datetime", "eventDate", "lastOccurrenceTime"),
-            "latitude": g("latitude", "lat"),
-            "longitude": g("longitude", "lon", "lng"),
-            "depth_km": g("depth_km", "depth"),
-            "magnitude": g("magnitude", "mag"),
-            "mag_type": g("type", "magType"),
-            "location": g("location", "title", "place"),
-            "province": g("province", "il"),
-            "district": g("district", "ilce"),
-            "country": g("country"),
-            "neighborhood": g("neighborhood", "mahalle"),
-            "rms": g("rms"),
-            "is_event_update": g("iseventupdate", "isEventUpdate"),
-            "last_update_time": g("lastupdatedate", "lastUpdate", "last_update_time"),
-        }
-        # Ensure every canonical field exists even if None (already covered by dict keys above)
-        return out
+    def _day_codes(t: pd.Series) -> np.ndarray:
+        """Istanbul calendar day of each tz-aware timestamp, as days since 1970-01-01."""
+        wall = t.dt.tz_localize(None).to_numpy()  # local wall-clock time
+        return wall.astype("datetime64[D]").astype(np.int64)
+
+    @staticmethod
+    def _day_code(value: str | pd.Timestamp) -> int:
+        """Day code (see _day_codes) of a single Europe/Istanbul date/time."""
+        ts = pd.Timestamp(value)
+        ts = ts.tz_localize(_TZ) if ts.tz is None else ts.tz_convert(_TZ)
+        return int(np.datetime64(ts.tz_localize(None), "D").astype(np.int64))
+
+    @staticmethod
+    def _day_starts(codes: Any, unit: str) -> pd.DatetimeIndex:
+        """Day codes → tz-aware Europe/Istanbul midnights at the given resolution."""
+        days = np.asarray(codes, dtype=np.int64).astype("datetime64[D]")
+        return pd.DatetimeIndex(days.astype(f"datetime64[{unit}]")).tz_localize(_TZ)
+
+    @staticmethod
+    def _utc64(value: str | pd.Timestamp) -> np.datetime64:
+        """Europe/Istanbul wall time → naive UTC datetime64, to compare with time.values."""
+        return pd.Timestamp(value, tz=_TZ).tz_convert("UTC").tz_localize(None).to_datetime64()
+
+    @staticmethod
+    def _iso_dates(df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Render tz-aware datetime columns as the ISO strings to_json would write.
+
+        to_json serializes tz-aware timestamps one object at a time; formatting
+        them up front as UTC millisecond strings is vectorized and far faster.
+        """
+        rendered = {}
+        for col in df.columns:
+            if not isinstance(df[col].dtype, pd.DatetimeTZDtype):
+                continue
+            utc = df[col].values  # naive UTC datetime64
+            text = np.char.add(np.datetime_as_string(utc, unit="ms"), "Z").astype(object)
+            text[np.isnat(utc)] = None
+            rendered[col] = text
+        return df.assign(**rendered) if rendered else df
+
+    @staticmethod
+    def _csv_dates(df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Render tz-aware datetime columns as the text to_csv would write.
+
+        Like _iso_dates, but in to_csv's "YYYY-MM-DD HH:MM:SS+HH:MM" local form.
+        Columns with sub-second times or odd (pre-1910 LMT) offsets are left to
+        pandas, whose exact output for those varies between versions.
+        """
+        rendered = {}
+        for col in df.columns:
+            if not isinstance(df[col].dtype, pd.DatetimeTZDtype):
+                continue
+            utc = df[col].values  # naive UTC datetime64
+            wall = df[col].dt.tz_localize(None).values
+            ok = ~np.isnat(utc)
+            if not ok.any():
+                continue
+            offset = (wall[ok] - utc[ok]) // np.timedelta64(1, "s")
+            if (utc[ok] != utc[ok].astype("datetime64[s]")).any() or (offset % 60).any():
+                continue
+            # Format each distinct UTC offset once (a handful at most), then gather.
+            minutes, where = np.unique(offset // 60, return_inverse=True)
+            suffix = np.array([
+                f"{'-' if m < 0 else '+'}{abs(m) // 60:02d}:{abs(m) % 60:02d}" for m in minutes
+            ])
+            stamp = np.strings.replace(np.datetime_as_string(wall[ok], unit="s"), "T", " ")
+            text = np.full(len(utc), None, dtype=object)
+            text[ok] = np.strings.add(stamp, suffix[where])
+            rendered[col] = text
+        return df.assign(**rendered) if rendered else df
+
+    @staticmethod
+    def _normalize_frame(df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Map heterogeneous AFAD keys to our canonical schema, column-wise.
+
+        For each canonical field the raw alias columns (see ALIAS_MAP) are
+        coalesced left-to-right; the consumed alias columns are then dropped.
+        Canonical fields with no alias present are left for the caller to add.
+        """
+        consumed: set = set()
+        for canon, aliases in ALIAS_MAP.items():
+            present = [a for a in aliases if a in df.columns]
+            if not present:
+                continue
+            if len(present) == 1:
+                df[canon] = df[present[0]]
+            else:
+                df[canon] = df[present].bfill(axis=1).iloc[:, 0]
+            consumed.update(present)
+
+        return df.drop(columns=[c for c in consumed if c not in ALIAS_MAP])
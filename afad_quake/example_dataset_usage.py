@@ -1,10 +1,28 @@
-from api import AfadAPI
+"""
+Fetch one week of AFAD events, aggregate daily energy and save it as CSV.
+
+For longer ranges, split the period into windows and fetch them together;
+`AfadAPI.fetch_many` issues the requests concurrently over one connection
+pool. A year in 52 weekly windows:
+
+    import datetime as dt
+
+    start = dt.datetime(2024, 1, 1)
+    weeks = [
+        (start + dt.timedelta(weeks=i), start + dt.timedelta(weeks=i + 1, seconds=-1))
+        for i in range(52)
+    ]
+    per_week = api.fetch_many(weeks, orderby="timedesc", extra_params={"minmag": 3.5})
+    raw = [event for week in per_week for event in week]
+"""
+
+from api import default_api
 from dataset import EarthquakeDataset
 from logger import configure_logging
 
 configure_logging()
 
-api = AfadAPI(base_url="https://servisnet.afad.gov.tr/apigateway/deprem")
+api = default_api("https://servisnet.afad.gov.tr/apigateway/deprem")
 raw = api.fetch_by_filter(
     start="2025-08-01 00:00:00",
     end="2025-08-07 23:59:59",
@@ -0,0 +1,65 @@
+"""Geometry value types shared by the API and dataset layers."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Tuple, Union
+
+
+@dataclass(slots=True, frozen=True)
+class BBox:
+    """
+    Latitude/longitude rectangle, validated once when it is built.
+
+    Field order matches the plain tuple form ``(min_lat, min_lon, max_lat, max_lon)``,
+    so ``BBox(*t)`` converts one. Reuse an instance across calls to skip re-validation.
+
+    Examples
+    --------
+    >>> west = BBox(36.0, 26.0, 40.0, 29.5)
+    >>> bool(west.contains(38.42, 27.14))
+    True
+    """
+
+    min_lat: float
+    min_lon: float
+    max_lat: float
+    max_lon: float
+
+    def __post_init__(self) -> None:
+        min_lat, min_lon, max_lat, max_lon = self.min_lat, self.min_lon, self.max_lat, self.max_lon
+        # Fast path: one chained check; only on failure work out which rule broke.
+        if -90.0 <= min_lat < max_lat <= 90.0 and -180.0 <= min_lon < max_lon <= 180.0:
+            return
+        if not (-90.0 <= min_lat <= 90.0 and -90.0 <= max_lat <= 90.0):
+            raise ValueError("Latitude must be in [-90, 90].")
+        if not (-180.0 <= min_lon <= 180.0 and -180.0 <= max_lon <= 180.0):
+            raise ValueError("Longitude must be in [-180, 180].")
+        if max_lat <= min_lat or max_lon <= min_lon:
+            raise ValueError("Invalid bbox: require max_lat>min_lat and max_lon>min_lon.")
+
+    @classmethod
+    def coerce(cls, value: "BBoxLike") -> "BBox":
+        """Return `value` unchanged if it is already a BBox, else build (and validate) one."""
+        if isinstance(value, cls):
+            return value
+        # Duck-typed: `afad_quake.BBox` and the flat-imported `geom.BBox` are distinct
+        # classes when both import styles are in play, so match on the fields instead.
+        if hasattr(value, "min_lat"):
+            return cls(value.min_lat, value.min_lon, value.max_lat, value.max_lon)
+        return cls(*value)
+
+    def contains(self, lats: Any, lons: Any) -> Any:
+        """
+        Elementwise inclusive containment test.
+
+        Works on scalars and NumPy arrays / pandas Series alike; NaN coordinates
+        compare False and are therefore outside.
+        """
+        return (
+            (lats >= self.min_lat) & (lats <= self.max_lat)
+            & (lons >= self.min_lon) & (lons <= self.max_lon)
+        )
+
+
+BBoxLike = Union[BBox, Tuple[float, float, float, float]]
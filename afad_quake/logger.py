@@ -2,21 +2,44 @@
 
 from __future__ import annotations
 import logging
+import time
 from typing import Optional
 
 LIB_LOGGER_NAME = "afad_quake"
 
+# Resolved once at import; logging.getLogger is a locked registry lookup.
+_LOGGER = logging.getLogger(LIB_LOGGER_NAME)
+if not _LOGGER.handlers:
+    _LOGGER.addHandler(logging.NullHandler())
+
+class _SecondCachedFormatter(logging.Formatter):
+    """Formatter that runs strftime once per wall-clock second, not per record."""
+
+    _cached = (None, "")
+
+    def formatTime(self, record: logging.LogRecord, datefmt: Optional[str] = None) -> str:
+        if datefmt is None:
+            return super().formatTime(record, datefmt)
+        key = (int(record.created), self.converter, datefmt)
+        cached_key, text = self._cached
+        if key != cached_key:
+            text = time.strftime(datefmt, self.converter(key[0]))
+            self._cached = (key, text)
+        return text
+
 def get_logger() -> logging.Logger:
     """
     Return the library logger. By default it has a NullHandler attached so it won't
     spam user applications unless they opt-in.
     """
-    logger = logging.getLogger(LIB_LOGGER_NAME)
-    if not logger.handlers:
-        logger.addHandler(logging.NullHandler())
-    return logger
+    return _LOGGER
 
-def configure_logging(level: int = logging.INFO, fmt: Optional[str] = None) -> None:
+def configure_logging(
+    level: int = logging.INFO,
+    fmt: Optional[str] = None,
+    utc: bool = False,
+    skip_thread_info: bool = False,
+) -> None:
     """
     Attach a StreamHandler to the library logger for quick visibility.
 
@@ -26,6 +49,13 @@ def configure_logging(level: int = logging.INFO, fmt: Optional[str] = None) -> N
         Logging level (e.g., logging.INFO).
     fmt : Optional[str]
         Custom format string. If None, a sensible default is used.
+    utc : bool
+        Stamp records in UTC (time.gmtime) instead of local time.
+    skip_thread_info : bool
+        Opt in to turning off the process-wide ``logging.logThreads``,
+        ``logProcesses`` and ``logMultiprocessing`` flags so records skip
+        thread/PID lookups. This affects every handler in the process:
+        %(thread)d, %(threadName)s and %(process)d then print None.
 
     Examples
     --------
@@ -33,15 +63,39 @@ def configure_logging(level: int = logging.INFO, fmt: Optional[str] = None) -> N
     >>> configure_logging()
     >>> # subsequent library calls will emit logs to stdout
     """
-    logger = logging.getLogger(LIB_LOGGER_NAME)
+    logger = _LOGGER
     logger.handlers.clear()
 
+    if skip_thread_info:
+        logging.logThreads = False
+        logging.logProcesses = False
+        logging.logMultiprocessing = False
+
     handler = logging.StreamHandler()
     handler.setLevel(level)
-    handler.setFormatter(logging.Formatter(
+    formatter = _SecondCachedFormatter(
         fmt or "[%(asctime)s] %(levelname)s %(name)s - %(message)s",
         datefmt="%Y-%m-%d %H:%M:%S"
-    ))
+    )
+    if utc:
+        formatter.converter = time.gmtime
+    handler.setFormatter(formatter)
 
     logger.setLevel(level)
     logger.addHandler(handler)
+    logger.disabled = False
+
+def silence(disabled: bool = True) -> None:
+    """
+    Switch the library logger off entirely, e.g. for batch scripts.
+
+    A disabled logger rejects every call on its first check, before any level
+    lookup or LogRecord is built. ``silence(False)`` or ``configure_logging()``
+    turns it back on.
+
+    Examples
+    --------
+    >>> from logger import silence
+    >>> silence()
+    """
+    _LOGGER.disabled = disabled